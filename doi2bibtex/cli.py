@@ -11,12 +11,8 @@ from typing import Any
 
 import sys
 
-from rich.console import Console, Text
-from rich.syntax import Syntax
-
 from doi2bibtex import __version__
 from doi2bibtex.config import Configuration
-from doi2bibtex.resolve import resolve_identifier
 
 
 # -----------------------------------------------------------------------------
@@ -64,6 +60,7 @@ def plain(identifier: str, config: Configuration) -> None:
     """
     Print the result plain text.
     """
+    from doi2bibtex.resolve import resolve_identifier
 
     # Get the BibTeX entry from the identifier
     bibtex = resolve_identifier(identifier=identifier, config=config)
@@ -76,6 +73,10 @@ def fancy(identifier: str, config: Configuration) -> None:
     """
     Print the result as a fancy rich console output.
     """
+    from rich.console import Console, Text
+    from rich.syntax import Syntax
+
+    from doi2bibtex.resolve import resolve_identifier
 
     # Set up a rich Console for some fancy output
     console = Console()
@@ -107,7 +108,10 @@ def search_by_title(title: str, config: Configuration, auto_select_first: bool =
     If auto_select_first is True, automatically select the first result.
     Otherwise, display results in interactive mode.
     """
-    from doi2bibtex.resolve import resolve_title
+    from rich.console import Console
+    from rich.syntax import Syntax
+
+    from doi2bibtex.resolve import resolve_identifier, resolve_title
     from doi2bibtex.interactive.selection import app as select_from_results
 
     console = Console()
@@ -168,15 +172,22 @@ def main() -> None:  # pragma: no cover
     Get identifier from the command line and resolve it.
     """
 
-    # Get command line arguments and load the configuration
+    # Fast path for `d2b --version`: no need to build the argument parser
+    if sys.argv[1:] == ["--version"]:
+        print(__version__)
+        sys.exit(0)
+
+    # Get command line arguments
     args = parse_cli_args(sys.argv[1:])
-    config = Configuration()
 
     # Print the version number and exit if requested
     if args.version:
         print(__version__)
         sys.exit(0)
 
+    # Only load the configuration once we know we actually need it
+    config = Configuration()
+
     # If --title is provided, search by title
     if args.title:
         search_by_title(title=args.title, config=config, auto_select_first=args.first)
@@ -19,6 +19,29 @@ import yaml
 
 class Configuration:
 
+    # Use __slots__ instead of an instance __dict__: attribute lookups become
+    # simple offset reads, and typos in config keys fail loudly. Note that this
+    # also means that no new attributes can be added to an instance at runtime.
+    __slots__ = (
+        "abbreviate_journal_names",
+        "citekey_delimiter",
+        "convert_latex_chars",
+        "convert_month_to_number",
+        "crossmatch_with_dblp",
+        "fix_arxiv_entrytype",
+        "format_author_names",
+        "generate_citekey",
+        "limit_authors",
+        "pygments_theme",
+        "remove_fields",
+        "remove_url_if_doi",
+        "resolve_adsurl",
+        "update_arxiv_if_doi",
+        "openalex_email",
+        "search_sources",
+        "merge_search_results",
+    )
+
     def __init__(self) -> None:
 
         # Define the default configuration
@@ -47,7 +70,9 @@ class Configuration:
         self.load_from_yaml_file()
 
     def __str__(self) -> str:
-        settings = [f"  {k}={repr(v)},\n" for k, v in vars(self).items()]
+        settings = [
+            f"  {k}={repr(getattr(self, k))},\n" for k in self.__slots__
+        ]
         return "Configuration(\n" + "".join(sorted(settings)) + ")"
 
     def load_from_yaml_file(self) -> None:
@@ -69,7 +94,7 @@ class Configuration:
 
         # Otherwise, update the configuration, only store known keys
         for key, value in config.items():
-            if hasattr(self, key):
+            if key in self.__slots__:
                 setattr(self, key, value)
             else:
                 warn(f'Warning: Ignoring unknown configuration key "{key}"!')
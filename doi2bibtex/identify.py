@@ -6,51 +6,122 @@ Methods for identifying the type of identifier (DOI or arXiv ID).
 # IMPORTS
 # -----------------------------------------------------------------------------
 
+from functools import lru_cache
+
 import re
 
-from isbnlib import is_isbn10, is_isbn13
+
+# -----------------------------------------------------------------------------
+# CONSTANTS
+# -----------------------------------------------------------------------------
+
+# Pattern for ADS bibcodes (basic format: "YYYYJJJJJVVVVMPPPPA")
+# For details, see: https://ui.adsabs.harvard.edu/help/actions/bibcode
+_ADS_PATTERN = re.compile(
+    r"^"
+    r"(?P<YYYY>\d{4})"
+    r"(?P<JJJJJ>[\w\.\&]{5})"
+    r"(?P<VVVV>[\w\.]{4})"
+    r"(?P<M>\S)"
+    r"(?P<PPPP>[\d\.]{4})"
+    r"(?P<A>[A-Z])"
+    r"$"
+)
+
+# Pattern for arXiv IDs (old and new format, fused into one alternation)
+# See: https://info.arxiv.org/help/arxiv_identifier.html
+_ARXIV_PATTERN = re.compile(
+    r"^(?:"
+    r"\d{4}.\d{4,5}(v\d+)?"
+    r"|[a-z\-]+(\.[A-Z]{2})?\/\d{7}(v\d+)?"
+    r")$"
+)
+
+# Pattern for DOIs (all variants fused into one alternation, so that the
+# input only needs to be scanned once)
+# See: https://www.crossref.org/blog/dois-and-matching-regular-expressions
+_DOI_PATTERN = re.compile(
+    r"^(?:"
+    r"10.\d{4,9}/[-.;()/:\w]+"
+    r"|10.1002/[^\s]+"
+    r"|10.\d{4}/\d+-\d+X?(\d+)\d+<[\d\w]+:[\d\w]*>\d+.\d+.\w+;\d"
+    r"|10.1021/\w\w\d+"
+    r"|10.1207/[\w\d]+\&\d+_\d+"
+    r")$"
+)
+
+# Translation table that deletes ASCII control characters, space and DEL
+# (non-ASCII characters are dropped beforehand via `encode("ascii")`)
+_NON_PRINT_TABLE = dict.fromkeys([*range(0x21), 0x7F])
+
+# Pattern used to extract an arXiv ID from URLs, DOIs and prefixed IDs, with
+# one named group per supported format. It is matched against the lower-cased
+# identifier, so it does not need the re.IGNORECASE flag.
+_ARXIV_EXTRACT_RE = re.compile(
+    # https://arxiv.org/abs/... or arxiv.org/abs/...
+    r"(?:https?://)?(?:www\.)?arxiv\.org/abs/(?P<url>.+)"
+    # https://doi.org/10.48550/arXiv.XXXX.XXXXX
+    r"|(?:https?://)?(?:www\.)?doi\.org/10\.48550/arxiv[\.:](?P<doi_url>.+)"
+    # 10.48550/arXiv.XXXX.XXXXX
+    r"|^10\.48550/arxiv[\.:](?P<doi>.+)"
+    # arXiv.XXXX.XXXXX or arXiv:XXXX.XXXXX
+    r"|^arxiv[\.:](?P<prefix>.+)"
+)
+
+# Pattern for the (lower-cased) archive and subject class of old-style arXiv
+# IDs, e.g. "math.gt/" in "math.gt/0309136" (subject classes are upper-case)
+_ARXIV_SUBJECT_CLASS_RE = re.compile(r"^([a-z\-]+)\.([a-z]{2})/")
 
 
 # -----------------------------------------------------------------------------
 # DEFINTIONS
 # -----------------------------------------------------------------------------
 
+# The predicates and the arXiv ID extraction below are pure string functions,
+# which are called repeatedly with the same inputs (e.g., in interactive mode,
+# where preprocess_arxiv_identifier() runs via process.preprocess_identifier()
+# on every resolve), so we memoize them.
+
+@lru_cache(maxsize=1024)
 def is_ads_bibcode(identifier: str) -> bool:
     """
     Check if the given `identifier` is an ADS bibcode.
     """
 
-    # Define a pattern for ADS bibcodes (basic format: "YYYYJJJJJVVVVMPPPPA")
-    # For details, see: https://ui.adsabs.harvard.edu/help/actions/bibcode
-    pattern = (
-        r"^"
-        r"(?P<YYYY>\d{4})"
-        r"(?P<JJJJJ>[\w\.\&]{5})"
-        r"(?P<VVVV>[\w\.]{4})"
-        r"(?P<M>\S)"
-        r"(?P<PPPP>[\d\.]{4})"
-        r"(?P<A>[A-Z])"
-        r"$"
-    )
+    # Bibcodes are 19 characters long and start with a 4-digit year
+    if len(identifier) < 19 or not identifier[:4].isdigit():
+        return False
 
-    return re.match(pattern, identifier) is not None
+    return _ADS_PATTERN.match(identifier) is not None
 
 
+@lru_cache(maxsize=1024)
 def is_arxiv_id(identifier: str) -> bool:
     """
     Check if the given `identifier` is an arXiv ID.
     """
 
-    # Define a list of arXiv ID patterns
-    # See: https://info.arxiv.org/help/arxiv_identifier.html
-    patterns = [
-        r"^\d{4}.\d{4,5}(v\d+)?$",
-        r"^[a-z\-]+(\.[A-Z]{2})?\/\d{7}(v\d+)?$",
-    ]
+    # New-style IDs start with "YYMM", old-style IDs contain a "/"
+    if not identifier[:4].isdigit() and "/" not in identifier:
+        return False
+
+    return _ARXIV_PATTERN.match(identifier) is not None
 
-    return any(re.match(pattern, identifier) for pattern in patterns)
 
+def remove_non_printable(identifier: str) -> str:
+    """
+    Remove non-printable ASCII characters, whitespace and non-ASCII
+    characters from the given `identifier` (i.e., keep only the characters
+    from "!" to "~").
+    """
 
+    return (
+        identifier.encode("ascii", "ignore").decode("ascii")
+        .translate(_NON_PRINT_TABLE)
+    )
+
+
+@lru_cache(maxsize=1024)
 def preprocess_arxiv_identifier(identifier: str) -> str:
     """
     Extract the arXiv ID from various formats.
@@ -72,73 +143,50 @@ def preprocess_arxiv_identifier(identifier: str) -> str:
     Returns the extracted arXiv ID or the original identifier if no pattern matches.
     """
 
-    # Remove non-printable ASCII characters and whitespace (keep only characters from ! to ~)
-    identifier = re.sub(r'[^\x21-\x7E]', '', identifier)
+    identifier = remove_non_printable(identifier)
 
-    # Pattern for https://arxiv.org/abs/... or arxiv.org/abs/...
-    arxiv_url_match = re.search(
-        r"(?:https?://)?(?:www\.)?arxiv\.org/abs/(.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if arxiv_url_match:
-        return arxiv_url_match.group(1).strip()
-
-    # Pattern for DOI URLs: https://doi.org/10.48550/arXiv.XXXX.XXXXX
-    doi_url_match = re.search(
-        r"(?:https?://)?(?:www\.)?doi\.org/10\.48550/arxiv[\.:](.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if doi_url_match:
-        return doi_url_match.group(1).strip()
-
-    # Pattern for DOI without domain: 10.48550/arXiv.XXXX.XXXXX
-    doi_prefix_match = re.search(
-        r"^10\.48550/arxiv[\.:](.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if doi_prefix_match:
-        return doi_prefix_match.group(1).strip()
-
-    # Pattern for arXiv prefix: arXiv.XXXX.XXXXX or arXiv:XXXX.XXXXX
-    arxiv_prefix_match = re.search(
-        r"^arxiv[\.:](.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if arxiv_prefix_match:
-        return arxiv_prefix_match.group(1).strip()
+    # Lower-case once and scan with a single pattern. The extracted ID is
+    # returned lower-cased, so that, e.g., "Hep-Th/9901001" or "2301.07041V2"
+    # become valid arXiv IDs, except for the subject class of old-style IDs,
+    # which is upper-case (e.g., "math.GT/0309136")
+    match = _ARXIV_EXTRACT_RE.search(identifier.lower())
+    if match and match.lastgroup is not None:
+        arxiv_id = match.group(match.lastgroup).strip()
+        return _ARXIV_SUBJECT_CLASS_RE.sub(
+            lambda m: f"{m[1]}.{m[2].upper()}/", arxiv_id, count=1
+        )
 
     # Return the identifier as-is if no pattern matched
     return identifier
 
 
+@lru_cache(maxsize=1024)
 def is_doi(identifier: str) -> bool:
     """
     Check if the given `identifier` is a DOI.
     """
 
-    # Define a list of DOI patterns
-    # See: https://www.crossref.org/blog/dois-and-matching-regular-expressions
-    patterns = [
-        r"^10.\d{4,9}/[-.;()/:\w]+$",
-        r"^10.1002/[^\s]+$",
-        r"^10.\d{4}/\d+-\d+X?(\d+)\d+<[\d\w]+:[\d\w]*>\d+.\d+.\w+;\d$",
-        r"^10.1021/\w\w\d+$",
-        r"^10.1207/[\w\d]+\&\d+_\d+$",
-    ]
+    # All DOIs start with the "10" directory indicator
+    if not identifier.startswith("10"):
+        return False
 
-    return any(re.match(pattern, identifier) for pattern in patterns)
+    return _DOI_PATTERN.match(identifier) is not None
 
 
+@lru_cache(maxsize=1024)
 def is_isbn(identifier: str) -> bool:
     """
     Check if the given `identifier` is an ISBN.
 
     This is just a super thin wrapper around `isbnlib.is_isbn10()` and
-    `isbnlib.is_isbn13()`.
+    `isbnlib.is_isbn13()`. The import is deferred to the first call, as
+    `isbnlib` is only needed once the cheaper checks have all failed.
     """
 
+    # An ISBN has at least 10 characters (ISBN-10 without any separators)
+    if len(identifier) < 10:
+        return False
+
+    from isbnlib import is_isbn10, is_isbn13
+
     return bool(is_isbn10(identifier)) or bool(is_isbn13(identifier))
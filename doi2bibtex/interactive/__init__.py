@@ -1,6 +1,27 @@
 """Interactive mode for doi2bibtex."""
 
-from doi2bibtex.interactive.interactive import app as interactive_mode, ocr_image
-from doi2bibtex.interactive.utils import format_authors, get_clipboard_image
+from importlib import import_module
+from typing import Any, List
 
 __all__ = ['interactive_mode', 'format_authors', 'get_clipboard_image', 'ocr_image']
+
+# Exported names and where they are defined. They are imported on first
+# access, so that importing a submodule (e.g., `selection` for the title
+# search of the CLI) does not load the whole interactive mode.
+_EXPORTS = {
+    'interactive_mode': ('doi2bibtex.interactive.interactive', 'app'),
+    'ocr_image': ('doi2bibtex.interactive.interactive', 'ocr_image'),
+    'format_authors': ('doi2bibtex.interactive.utils', 'format_authors'),
+    'get_clipboard_image': ('doi2bibtex.interactive.utils', 'get_clipboard_image'),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _EXPORTS[name]
+    return getattr(import_module(module_name), attribute)
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
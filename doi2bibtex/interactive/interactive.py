@@ -6,16 +6,28 @@ Interactive console mode for searching papers by title.
 # IMPORTS
 # -----------------------------------------------------------------------------
 
-
-from rich.console import Console
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.text import Text
 from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
 from prompt_toolkit.key_binding.bindings import emacs
 from prompt_toolkit.enums import EditingMode
+from prompt_toolkit.eventloop import run_in_executor_with_context
 from prompt_toolkit.formatted_text import FormattedText
+from prompt_toolkit.history import History
 from prompt_toolkit.shortcuts import PromptSession
 
+from doi2bibtex.config import Configuration
+from doi2bibtex.identify import is_arxiv_id, is_doi
+from doi2bibtex.process import preprocess_identifier
 from doi2bibtex.resolve import resolve_identifier, resolve_title
 
 from doi2bibtex.interactive.utils import (
@@ -23,21 +35,152 @@ from doi2bibtex.interactive.utils import (
   ocr,
   normalize_text,
   copy_to_clipboard,
+  warm_up_ocr,
+  read_key,
+  HAS_POSIX_TTY,
 )
 
 from doi2bibtex.interactive.selection import app as select_from_results
 
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from rich.syntax import SyntaxTheme
+
+# Windows console module used to read a single key press (the POSIX terminal
+# modules are probed in utils)
+try:
+    import msvcrt
+    HAS_MSVCRT = True
+except ImportError:
+    HAS_MSVCRT = False
+
 # Special return values for PromptSession control flow
 RESULT_MODE_SWITCH = "__MODE_SWITCH__"
 RESULT_OCR_REQUESTED = "__OCR_REQUESTED__"
 COPY_EVENT_TRIGGER_CHAR = 'c'
+# Keys accepted for the copy event (compared as is, without lower-casing)
+COPY_EVENT_TRIGGER_KEYS = (COPY_EVENT_TRIGGER_CHAR, COPY_EVENT_TRIGGER_CHAR.upper())
+
+# Time (in seconds) the selection has to stay on a search result before we
+# resolve it in advance, so that scrolling through the results does not query
+# the APIs (e.g., ADS, which has a quota) for every result scrolled past
+PREFETCH_DELAY = 0.3
+
+# OCR runs on a daemon thread, so that the main thread only waits for it and
+# Ctrl+C returns to the prompt instead of waiting for the engine. Note that an
+# OCR that already started cannot be stopped: it keeps running in the
+# background (exiting the program does not wait for it), and the next OCR
+# waits for it, as the engine runs one image at a time under this lock
+OCR_LOCK = threading.Lock()
+
+# Lookups already done in this session (least recently used first), so that
+# submitting the same DOI or title again does not go through the network.
+# Failed lookups are not cached, so that they can simply be retried
+RESOLVE_CACHE_SIZE = 256
+_resolve_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+_resolve_cache_lock = threading.Lock()
+
+# Time (in seconds) to wait for a result before showing a spinner: cached
+# lookups and OCR results are ready right away and do not need one
+SPINNER_DELAY = 0.1
+
+# Maximum number of entries kept in the input history
+HISTORY_SIZE = 1000
+
+class SessionHistory(History):
+    """
+    In-memory input history that keeps each entry only once (at the position
+    of its most recent use) and at most `max_size` entries, dropping the
+    oldest ones. A set of the entries tells whether a submitted string is
+    new without scanning the history; only re-submitted entries are moved
+    from their old position, which is linear in the (bounded) history size.
+    """
 
-def bibtex_to_clipboard(console, bibtex):
+    def __init__(self, max_size: int = HISTORY_SIZE) -> None:
+        super().__init__()
+        self._entries: Deque[str] = deque(maxlen=max_size)  # oldest first
+        self._seen: Set[str] = set()
+
+    def load_history_strings(self) -> Iterable[str]:
+        # History expects the most recent entries first
+        return reversed(self._entries)
+
+    def store_string(self, string: str) -> None:
+        if string in self._seen:
+            self._entries.remove(string)
+        elif len(self._entries) == self._entries.maxlen:
+            self._seen.discard(self._entries[0])
+        self._entries.append(string)
+        self._seen.add(string)
+
+    def append_string(self, string: str) -> None:
+        # Apply the same change to the loaded strings (most recent first),
+        # which always mirror the entries, instead of rebuilding them
+        if string in self._seen:
+            self._loaded_strings.remove(string)
+        elif len(self._entries) == self._entries.maxlen:
+            self._loaded_strings.pop()
+        self._loaded_strings.insert(0, string)
+        self.store_string(string)
+
+def get_cached_lookup(key: Hashable) -> Any:
+    """Return the cached result of a lookup, or None if it is not cached."""
+    with _resolve_cache_lock:
+        if key not in _resolve_cache:
+            return None
+        _resolve_cache.move_to_end(key)
+        return _resolve_cache[key]
+
+def cache_lookup(key: Hashable, result: Any) -> None:
+    with _resolve_cache_lock:
+        _resolve_cache[key] = result
+        if len(_resolve_cache) > RESOLVE_CACHE_SIZE:
+            _resolve_cache.popitem(last=False)
+
+def cached_resolve_identifier(identifier: str, config: Configuration) -> str:
+    """
+    Resolve `identifier` to a BibTeX entry (raising on error), reusing the
+    entry if the identifier was already resolved during this session.
+    """
+    key = ("identifier", identifier, config)
+    bibtex: Optional[str] = get_cached_lookup(key)
+    if bibtex is None:
+        bibtex = resolve_identifier(identifier=identifier, config=config, raise_on_error=True)
+        cache_lookup(key, bibtex)
+    return bibtex
+
+def cached_resolve_title(
+    title: str, config: Configuration
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Search papers by `title`, reusing the results if the same title was
+    already searched during this session. Searches for which a source
+    failed (i.e., with warnings) are not cached, as they may be incomplete.
+    """
+    key = ("title", title, config)
+    found: Optional[Tuple[List[Dict[str, Any]], List[str]]] = get_cached_lookup(key)
+    if found is None:
+        found = resolve_title(title, config)
+        if found[0] and not found[1]:
+            cache_lookup(key, found)
+    return found
+
+def bibtex_to_clipboard(console: Console, bibtex: str) -> None:
     if copy_to_clipboard(bibtex):
         console.print("\n[green bold]✓ BibTeX copied to clipboard![/green bold]\n")
     else:
         console.print(f"\n[yellow]Could not copy to clipboard[/yellow]\n")
 
+def handle_pause_key(console: Console, bibtex: str, char: str) -> None:
+    """
+    Handle the key pressed while the BibTeX entry is displayed: copy the
+    entry to the clipboard for the copy key, just continue otherwise.
+    """
+    if char in COPY_EVENT_TRIGGER_KEYS:
+        bibtex_to_clipboard(console, bibtex)
+    else:
+        console.print()  # Just add newline
+
 def linux_terminal_buffer(console, bibtex):
     """
     Switch to raw terminal to allow user to select previous displayed text
@@ -45,85 +188,76 @@ def linux_terminal_buffer(console, bibtex):
     prompt_toolkit does not allow to select previous text because it
     captures all the events and would be too much burden to implement
     """
-    import sys
-    import tty
-    import termios
-
-    # Save terminal settings
-    old_settings = termios.tcgetattr(sys.stdin)
+    # Read single character (terminal settings are restored right after)
+    fd = sys.stdin.fileno()
     try:
-        # Set terminal to raw mode to read single character
-        tty.setraw(sys.stdin.fileno())
-        char = sys.stdin.read(1).lower()
-
-        # Restore terminal settings immediately
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-
-        # If user pressed 'c', copy to clipboard
-        if char == COPY_EVENT_TRIGGER_CHAR:
-            bibtex_to_clipboard(console, bibtex)
-        else:
-            console.print()  # Just add newline
-
+        char = read_key(fd)
     except Exception:
-        # Restore settings on error
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-        console.print()
+        char = ""
+
+    handle_pause_key(console, bibtex, char)
 
 def windows_terminal_buffer(console, bibtex):
-    import msvcrt
-    char = msvcrt.getch().decode('utf-8').lower()
+    char = msvcrt.getch().decode('utf-8')
 
-    if char == COPY_EVENT_TRIGGER_CHAR:
-        bibtex_to_clipboard(console, bibtex)
-    else:
-        console.print()
+    handle_pause_key(console, bibtex, char)
 
 def fallback_terminal_buffer(console, bibtex):
-    user_input = input().strip().lower()
-    if user_input == 'c':
-        bibtex_to_clipboard(console, bibtex)
-    else:
-        console.print()
+    user_input = input().strip()
+    handle_pause_key(console, bibtex, user_input)
+
+@lru_cache(maxsize=4)
+def get_bibtex_highlighting(theme: str) -> Tuple["Lexer", "SyntaxTheme"]:
+    """
+    Return the Pygments BibTeX lexer and the rich syntax theme used to
+    display BibTeX entries. Looking them up by name goes through the Pygments
+    plugin registry, so we do it once (per theme) instead of for every entry.
+    """
+    # Imported here as it pulls in Pygments (only needed once we display)
+    from pygments.lexers.bibtex import BibTeXLexer
+    from rich.syntax import Syntax
+
+    return BibTeXLexer(), Syntax.get_theme(theme)
 
 def display_bibtex(bibtex: str, console: Console, config) -> None:
     """
     Display BibTeX with syntax highlighting and pause to allow text selection.
     User can optionally copy to clipboard by pressing 'c'.
     """
-    console.print(f'[green]BibTeX entry:[/green]\n')
+    from rich.syntax import Syntax
 
     # Apply syntax highlighting
+    lexer, theme = get_bibtex_highlighting(config.pygments_theme)
     syntax = Syntax(
         code=bibtex,
-        lexer="bibtex",
-        theme=config.pygments_theme,
+        lexer=lexer,
+        theme=theme,
         word_wrap=True,
     )
-    console.print(syntax)
 
-    # Display pause message with copy option
-    console.print(Panel.fit(
-        "[bold cyan]You can now select and copy the BibTeX text above[/bold cyan]\n\n"
-        "[dim]Press 'c' to copy to clipboard, or any other key to continue...[/dim]",
-        border_style="cyan"
+    # Display the entry and the pause message with copy option, printed as
+    # a single group so that the console renders and writes them only once
+    console.print(Group(
+        Text.from_markup('[green]BibTeX entry:[/green]\n'),
+        syntax,
+        Panel.fit(
+            "[bold cyan]You can now select and copy the BibTeX text above[/bold cyan]\n\n"
+            "[dim]Press 'c' to copy to clipboard, or any other key to continue...[/dim]",
+            border_style="cyan"
+        ),
     ))
 
     try:
         # Read single character without waiting for ENTER
         # This allows text selection since prompt_toolkit is not active
-        try:
+        # (if stdin is not a terminal, e.g. a pipe, we fall back to a line)
+        if HAS_POSIX_TTY and sys.stdin.isatty():
             linux_terminal_buffer(console, bibtex)
             return
-        except (ImportError, AttributeError):
-            pass
-        
-        try:
+        elif HAS_MSVCRT:
             windows_terminal_buffer(console, bibtex)
             return
-        except (ImportError, AttributeError):
-            pass
-        
+
         fallback_terminal_buffer(console, bibtex)
     
     except (KeyboardInterrupt, EOFError):
@@ -133,19 +267,66 @@ def display_bibtex(bibtex: str, console: Console, config) -> None:
 
     
 
+def run_in_daemon_thread(
+    fn: Callable[..., Any], *args: Any, lock: Optional[threading.Lock] = None
+) -> Future:
+    """
+    Call `fn(*args)` on a new daemon thread and return a Future of its result.
+    Network lookups run this way, so that Ctrl+C while waiting for one returns
+    to the prompt. The request itself cannot be interrupted: it completes in
+    the background and its result is dropped. As the thread is a daemon
+    thread, a request that hangs neither blocks later lookups nor delays
+    exiting the program. If given, `lock` is held during the call, so that
+    calls sharing it run one at a time (and can be cancelled while waiting).
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        with lock or nullcontext():
+            # Skip the call if the future was cancelled before it could run
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+def wait_for(future: Future, console: Console, status: str, **kwargs: Any) -> Any:
+    """
+    Wait for the result of `future`, showing a spinner with the `status`
+    message (and `kwargs`, passed to console.status) if it is not ready
+    within SPINNER_DELAY seconds. Starting the spinner sets up a render
+    thread, which is wasted for results that are already (nearly) there.
+    """
+    try:
+        return future.result(timeout=SPINNER_DELAY)
+    except FutureTimeoutError:
+        with console.status(status, **kwargs):
+            return future.result()
+
 def ocr_image(image_source, console: Console) -> str:
     """
     Perform OCR on an image to extract text using RapidOCR.
     image_source can be a file path (str) or PIL Image object.
     """
+    future = run_in_daemon_thread(ocr, image_source, lock=OCR_LOCK)
     try:
         # Display OCR in progress animation
-        with console.status("[cyan]OCR in progress...", spinner="dots"):
-            return ocr(image_source)
+        text: str = wait_for(future, console, "[cyan]OCR in progress...", spinner="dots")
+        return text
+    except KeyboardInterrupt:
+        # The engine cannot be interrupted, so we just stop waiting for it.
+        # This only drops the OCR if it is still queued, once started it runs
+        # to completion (and its result ends up in the OCR cache)
+        future.cancel()
+        return "Error performing OCR: cancelled"
     except Exception as e:
         return f"Error performing OCR: {e}"
 
-def key_bindings(toolbar_message=None, search_mode=None, txt_buffer=None):
+def key_bindings(toolbar_message=None, search_mode=None, txt_buffer=None, pasted_image=None):
     # Key bindings - defined once, reused for all prompts
     kb = KeyBindings()
 
@@ -158,13 +339,20 @@ def key_bindings(toolbar_message=None, search_mode=None, txt_buffer=None):
         event.app.exit(result=buffer.text)
 
     @kb.add('c-v')  # Ctrl+V for image paste only
-    def _(event):
+    async def _(event):
         """Paste image from clipboard for OCR"""
-        # Try to get image from clipboard
-        clipboard_image = get_clipboard_image()
+        # Try to get image from clipboard. This can be slow (e.g., on X11),
+        # so it runs on a worker thread while the prompt stays responsive
+        clipboard_image = await run_in_executor_with_context(get_clipboard_image)
+
+        # The prompt may have been closed in the meantime (e.g., Enter)
+        if event.app.is_done:
+            return
 
         if clipboard_image:
-            # It's an image! Exit with special result to trigger OCR mode
+            # It's an image! Keep it for the OCR (so that we don't need to
+            # grab the clipboard again) and exit to trigger OCR mode
+            pasted_image[0] = clipboard_image
             event.app.exit(result=RESULT_OCR_REQUESTED)
         else:
             # No image in clipboard - show message in toolbar
@@ -189,30 +377,51 @@ def key_bindings(toolbar_message=None, search_mode=None, txt_buffer=None):
 
     return kb
 
+# Bottom toolbars for each search mode (without message). They are built once
+# here, as the toolbar is rebuilt on every redraw (i.e., on every key press)
+MODE_TOOLBARS = {
+    "title": FormattedText([
+        ('bg:#0066cc #ffffff bold', ' Title Mode '),
+        ('', ' | '),
+        ('#888888', 'DOI Mode'),
+        ('', '     '),
+        ('#888888 italic', '(Shift+Tab to cycle)'),
+    ]),
+    "doi": FormattedText([
+        ('#888888', 'Title Mode'),
+        ('', ' | '),
+        ('bg:#0066cc #ffffff bold', ' DOI Mode '),
+        ('', '     '),
+        ('#888888 italic', '(Shift+Tab to cycle)'),
+    ]),
+}
+
+# Toolbars with a message already built, keyed by (search mode, message)
+TOOLBAR_CACHE_SIZE = 32
+_toolbar_cache: Dict[Any, FormattedText] = {}
+
 # Create bottom toolbar showing current mode
 def bottom_toolbar(toolbar_message=None, search_mode=None):
     """Generate bottom toolbar with mode indicator"""
-    # Build mode indicator
-    if search_mode[0] == "title":
-        toolbar_parts = [
-            ('bg:#0066cc #ffffff bold', ' Title Mode '),
-            ('', ' | '),
-            ('#888888', 'DOI Mode'),
-            ('', '     '),
-            ('#888888 italic', '(Shift+Tab to cycle)'),
-        ]
-    else:
-        toolbar_parts = [
-            ('#888888', 'Title Mode'),
-            ('', ' | '),
-            ('bg:#0066cc #ffffff bold', ' DOI Mode '),
-            ('', '     '),
-            ('#888888 italic', '(Shift+Tab to cycle)'),
-        ]
+    if toolbar_message[0] is None:
+        return MODE_TOOLBARS[search_mode[0]]
+
+    key = (search_mode[0], toolbar_message[0])
+    toolbar = _toolbar_cache.get(key)
+    if toolbar is None:
+        if len(_toolbar_cache) >= TOOLBAR_CACHE_SIZE:
+            _toolbar_cache.clear()
+        toolbar = _toolbar_cache[key] = build_toolbar(*key)
+    return toolbar
+
+def build_toolbar(mode: str, message: Optional[Tuple[str, str]]) -> FormattedText:
+    """Build the bottom toolbar for a search mode and an optional message"""
+    # Copy the mode indicator, so that the message is not added to it
+    toolbar_parts = list(MODE_TOOLBARS[mode])
 
     # Add message if present
-    if toolbar_message[0] is not None:
-        msg_type, msg_text = toolbar_message[0]
+    if message is not None:
+        msg_type, msg_text = message
         toolbar_parts.append(('', '     '))  # Spacing
         if msg_type == "error":
             toolbar_parts.append(('bg:#d32f2f #ffffff bold', f' ✗ {msg_text} '))
@@ -226,7 +435,7 @@ def bottom_toolbar(toolbar_message=None, search_mode=None):
     return FormattedText(toolbar_parts)
 
 
-def handle_user_input(session=None, console=None, search_mode=None, txt_buffer=None):
+def handle_user_input(session=None, console=None, search_mode=None, txt_buffer=None, pasted_image=None):
     prompt_text = "Title: " if search_mode[0] == "title" else "DOI: "
 
     # Use preserved text as default (from mode switch), then clear it
@@ -242,8 +451,9 @@ def handle_user_input(session=None, console=None, search_mode=None, txt_buffer=N
         return
     
     if input_text == RESULT_OCR_REQUESTED:
-        # User pressed Ctrl+V with an image in clipboard
-        clipboard_image = get_clipboard_image()
+        # User pressed Ctrl+V with an image in clipboard (use it only once)
+        clipboard_image = pasted_image[0]
+        pasted_image[0] = None
         if not clipboard_image:
             # Normal text input
             console.print("[yellow]No input provided.[/yellow]")
@@ -258,8 +468,10 @@ def handle_user_input(session=None, console=None, search_mode=None, txt_buffer=N
             console.print(f"[red]{ocr_text}[/red]")
             return
 
-        console.print(f"\n[green]Extracted text:[/green]\n{ocr_text}\n")
-        console.print("[cyan]Edit the text if needed, then press Enter to search[/cyan]\n")
+        console.print(
+            f"\n[green]Extracted text:[/green]\n{ocr_text}\n\n"
+            "[cyan]Edit the text if needed, then press Enter to search[/cyan]\n"
+        )
 
         # Let user edit the OCR result
         ocr_edited_txt = session.prompt(message="Edit: ", default=ocr_text)
@@ -280,12 +492,22 @@ def handle_user_input(session=None, console=None, search_mode=None, txt_buffer=N
     
     return processed_input
     
-def handle_user_doi(console=None, config=None, identifier=None, toolbar_message=None):
+def handle_user_doi(console=None, config=None, identifier=None, toolbar_message=None, prefetched=None):
+    # Use the prefetched entry unless it was cancelled before it ran
+    if prefetched is not None and not prefetched.cancelled():
+        future = prefetched
+    else:
+        future = run_in_daemon_thread(cached_resolve_identifier, identifier, config)
+
     try:
-        with console.status("Resolving DOI..."):
-            bibtex = resolve_identifier(identifier=identifier, config=config, raise_on_error=True)
+        bibtex = wait_for(future, console, "Resolving DOI...")
 
         display_bibtex(bibtex, console, config)
+    except KeyboardInterrupt:
+        future.cancel()
+        console.print("\n[yellow]Cancelled.[/yellow]\n")
+        toolbar_message[0] = ("warning", "Cancelled")
+        return False
     except Exception as e:
         console.print(f"\n[red bold]Error:[/red bold] {str(e)}\n")
         toolbar_message[0] = ("error", f"Error resolving identifier")
@@ -293,9 +515,20 @@ def handle_user_doi(console=None, config=None, identifier=None, toolbar_message=
 
     return True
 
+def is_identifier(text: str) -> bool:
+    """
+    Check if `text` is a DOI or an arXiv ID (possibly as a URL or with a
+    prefix), rather than a title. Titles contain spaces, identifiers do not.
+    """
+    if ' ' in text:
+        return False
+    identifier = preprocess_identifier(text)
+    return is_doi(identifier) or is_arxiv_id(identifier)
+
 def resolve_user_input(console=None, search_mode=None, input_text=None, config=None, toolbar_message=None):
-    # DOI mode
-    if search_mode[0] == "doi":
+    # DOI mode (identifiers pasted in title mode are resolved directly too,
+    # instead of searching for them as a title and then resolving the DOI)
+    if search_mode[0] == "doi" or is_identifier(input_text):
 
         console.print(f"\n[cyan]Searching for: {input_text}[/cyan]\n")
         handle_user_doi(
@@ -308,26 +541,62 @@ def resolve_user_input(console=None, search_mode=None, input_text=None, config=N
 
     # Title mode
     console.print(f"\n[cyan]Searching for: {input_text}[/cyan]\n")
+    future = run_in_daemon_thread(cached_resolve_title, input_text, config)
     try:
-        with console.status("Searching..."):
-            results, warnings = resolve_title(input_text, config)
+        results, warnings = wait_for(future, console, "Searching...")
 
         if not results:
             console.print(f"\n[yellow]No results found. Try a different search term.[/yellow]\n")
             toolbar_message[0] = ("warning", "No results found")
             return
+    except KeyboardInterrupt:
+        future.cancel()
+        console.print("\n[yellow]Cancelled.[/yellow]\n")
+        toolbar_message[0] = ("warning", "Cancelled")
+        return
     except Exception as e:
         console.print(f"\n[red bold]Search error:[/red bold] {str(e)}\n")
         toolbar_message[0] = ("error", "Search error")
         return
 
-    selected_doi = select_from_results(results, input_text, console, config, warnings)
+    # Resolve the highlighted result in the background once the selection
+    # stays on it, so that the BibTeX entry is (mostly) ready once selected
+    prefetched: Dict[str, Future] = {}
+    pending: List[Optional[threading.Timer]] = [None]  # Prefetch not started yet
+
+    def start_prefetch(doi: str) -> None:
+        prefetched[doi] = run_in_daemon_thread(cached_resolve_identifier, doi, config)
+
+    def prefetch(result: Dict[str, Any]) -> None:
+        # Drop the prefetch of the previous result if it was only scrolled past
+        if pending[0] is not None:
+            pending[0].cancel()
+            pending[0] = None
+        doi = result.get("doi")
+        if not doi or doi in prefetched:
+            return
+        timer = threading.Timer(PREFETCH_DELAY, start_prefetch, args=(doi,))
+        timer.daemon = True
+        timer.start()
+        pending[0] = timer
+
+    try:
+        selected_doi = select_from_results(
+            results, input_text, console, config, warnings, on_highlight=prefetch
+        )
+    finally:
+        # Lookups that already started keep running in the background (their
+        # result is cached), we just do not start a new one
+        if pending[0] is not None:
+            pending[0].cancel()
+
     if selected_doi:
         handle_user_doi(
             console=console,
             config=config,
             identifier=selected_doi,
-            toolbar_message=toolbar_message
+            toolbar_message=toolbar_message,
+            prefetched=prefetched.get(selected_doi),
         )
 
 def app(config) -> None:
@@ -353,12 +622,22 @@ def app(config) -> None:
         border_style="cyan"
     ))
 
+    # Load the OCR engine in the background while the user types the first
+    # query, so that the first image paste does not wait for it
+    run_in_daemon_thread(warm_up_ocr, lock=OCR_LOCK)
+
     # State variables (as list for mutable effect over function args passing)
     search_mode = ["title"]  # "title" or "doi"
     toolbar_message = [None]  # Message to display in toolbar (persistent across iterations)
     txt_buffer = [None]  # Text to preserve when switching modes or after OCR
+    pasted_image = [None]  # Image pasted with Ctrl+V, waiting for OCR
 
-    kb = key_bindings(toolbar_message=toolbar_message, search_mode=search_mode, txt_buffer=txt_buffer)
+    kb = key_bindings(
+        toolbar_message=toolbar_message,
+        search_mode=search_mode,
+        txt_buffer=txt_buffer,
+        pasted_image=pasted_image,
+    )
     # Merge custom key bindings with default emacs bindings
     merged_bindings = merge_key_bindings([
         emacs.load_emacs_bindings(),
@@ -368,8 +647,8 @@ def app(config) -> None:
     get_bottom_toolbar = lambda : bottom_toolbar(toolbar_message=toolbar_message, search_mode=search_mode)
 
     # Create PromptSession - reused for all inputs
-    # PromptSession uses InMemoryHistory by default
     session = PromptSession(
+        history=SessionHistory(),
         multiline=True,
         wrap_lines=True,
         editing_mode=EditingMode.EMACS,
@@ -383,7 +662,8 @@ def app(config) -> None:
                 session=session,
                 console=console,
                 search_mode=search_mode,
-                txt_buffer=txt_buffer
+                txt_buffer=txt_buffer,
+                pasted_image=pasted_image,
             )
             if not input_text:
                 continue
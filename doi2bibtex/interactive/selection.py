@@ -1,14 +1,21 @@
-from typing import List, Dict, Optional, Any
+import sys
+from typing import Callable, List, Dict, Optional, Any, Tuple
 
 from prompt_toolkit.application import Application
+from prompt_toolkit.cache import SimpleCache
+from prompt_toolkit.formatted_text import StyleAndTextTuples
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout.containers import HSplit, Window
 from prompt_toolkit.layout.controls import UIControl, UIContent
 from prompt_toolkit.layout.layout import Layout
 from prompt_toolkit.mouse_events import MouseEventType
-from rich.panel import Panel
 
-from doi2bibtex.interactive.utils import parse_jats_text, format_authors
+from doi2bibtex.interactive.utils import (
+    HAS_POSIX_TTY,
+    format_authors,
+    parse_jats_text,
+    read_key,
+)
 
 
 class ResultsControl(UIControl):
@@ -21,6 +28,15 @@ class ResultsControl(UIControl):
         self.current_index = 0
         self.scroll_offset = 0
         self.lines_per_result = 6  # title + identifier + authors + year/journal + type/publisher + empty line
+        # Text of each result, extracted once (the list does not change while
+        # it is displayed), so that rendering a row only has to apply styles
+        self._result_texts = [self.result_texts(i, result) for i, result in enumerate(results)]
+        # Rendered lines of each result, keyed by (index, is_selected), so that
+        # moving the selection only renders the two rows whose style changed
+        self._result_lines: Dict[Tuple[int, bool], List[StyleAndTextTuples]] = {}
+        # Content of the last screens, keyed by what they depend on, so that
+        # redraws that do not change the selection reuse them as they are
+        self._content_cache: SimpleCache[Tuple[int, int, int], UIContent] = SimpleCache(maxsize=8)
 
     def create_content(self, width: int, height: int) -> UIContent:
         """Generate the content to display"""
@@ -42,8 +58,13 @@ class ResultsControl(UIControl):
         # Ensure scroll_offset is valid
         self.scroll_offset = max(0, min(self.scroll_offset, len(self.results) - visible_results))
 
+        key = (self.current_index, self.scroll_offset, visible_results)
+        return self._content_cache.get(key, lambda: self.build_content(visible_results))
+
+    def build_content(self, visible_results: int) -> UIContent:
+        """Build the content for the current selection and scroll offset"""
         # Build the display lines - each line is a list of (style, text) tuples
-        lines = []
+        lines: List[StyleAndTextTuples] = []
 
         # Header
         lines.append([("class:header", f"Search results for: {self.original_query}")])
@@ -63,37 +84,11 @@ class ResultsControl(UIControl):
         # Display visible results
         end_index = min(len(self.results), self.scroll_offset + visible_results)
         for i in range(self.scroll_offset, end_index):
-            result = self.results[i]
             is_selected = (i == self.current_index)
-            prefix = "► " if is_selected else "  "
-            style = "class:selected" if is_selected else ""
-            source_style = "class:selected italic" if is_selected else "italic"
-            title_style = "class:selected fg:#fff176" if is_selected else "fg:cyan"
-
-            title = result.get("title", "")
-            identifier = result.get("doi", "")
-            year = result.get("year", "") or "✗"
-            journal = result.get("journal", "") or "✗"
-            authors = format_authors(result.get("authors", []), max_authors=3)
-            pub_type = result.get("type", "") or "✗"
-            publisher = result.get("publisher", "") or "✗"
-            source = result.get("source")
-
-            # Truncate long fields
-            if publisher != "✗" and len(publisher) > 40:
-                publisher = publisher[:37] + "..."
-            if journal != "✗" and len(journal) > 40:
-                journal = journal[:37] + "..."
-
-            lines.append([(title_style, f"{prefix}[{i+1}] {title}")])
-            lines.append([
-                (f"{style} bold", f"    Identifier: {identifier} "),
-                (source_style, f"(from {source})")
-            ])
-            lines.append([(style, f"    Authors: {authors}")])
-            lines.append([(style, f"    Year: {year}, Journal: {journal}")])
-            lines.append([(style, f"    Type: {pub_type}, Publisher: {publisher}")])
-            lines.append([("", "")])
+            key = (i, is_selected)
+            if key not in self._result_lines:
+                self._result_lines[key] = self.render_result(i, is_selected)
+            lines.extend(self._result_lines[key])
 
         # Show scroll indicator at bottom
         if end_index < len(self.results):
@@ -105,12 +100,63 @@ class ResultsControl(UIControl):
         lines.append([("", "")])
         lines.append([("fg:cyan", "Navigation: [↑↓] Navigate  [SPACE] View abstract  [ENTER] Select  [ESC] Cancel")])
 
+        # prompt_toolkit only asks for lines below line_count, so the list
+        # can be indexed directly instead of through a bounds-checking lambda
         return UIContent(
-            get_line=lambda i: lines[i] if i < len(lines) else [("", "")],
+            get_line=lines.__getitem__,
             line_count=len(lines),
             show_cursor=False,
         )
 
+    @staticmethod
+    def result_texts(i: int, result: Dict[str, Any]) -> Tuple[str, str, str, str, str, str]:
+        """Extract the (unstyled) text of the lines of the i-th result"""
+        title = result.get("title", "")
+        identifier = result.get("doi", "")
+        year = result.get("year", "") or "✗"
+        journal = result.get("journal", "") or "✗"
+        authors = format_authors(result.get("authors", []), max_authors=3)
+        pub_type = result.get("type", "") or "✗"
+        publisher = result.get("publisher", "") or "✗"
+        source = result.get("source")
+
+        # Truncate long fields
+        if publisher != "✗" and len(publisher) > 40:
+            publisher = publisher[:37] + "..."
+        if journal != "✗" and len(journal) > 40:
+            journal = journal[:37] + "..."
+
+        return (
+            f"[{i+1}] {title}",
+            f"    Identifier: {identifier} ",
+            f"(from {source})",
+            f"    Authors: {authors}",
+            f"    Year: {year}, Journal: {journal}",
+            f"    Type: {pub_type}, Publisher: {publisher}",
+        )
+
+    def render_result(self, i: int, is_selected: bool) -> List[StyleAndTextTuples]:
+        """Render the lines of the i-th result"""
+        prefix = "► " if is_selected else "  "
+        style = "class:selected" if is_selected else ""
+        source_style = "class:selected italic" if is_selected else "italic"
+        title_style = "class:selected fg:#fff176" if is_selected else "fg:cyan"
+
+        title, identifier, source, authors, year_journal, type_publisher = self._result_texts[i]
+
+        lines: List[StyleAndTextTuples] = []
+        lines.append([(title_style, prefix + title)])
+        lines.append([
+            (f"{style} bold", identifier),
+            (source_style, source)
+        ])
+        lines.append([(style, authors)])
+        lines.append([(style, year_journal)])
+        lines.append([(style, type_publisher)])
+        lines.append([("", "")])
+
+        return lines
+
     def mouse_handler(self, mouse_event):
         """Handle mouse events (optional)"""
         if mouse_event.event_type == MouseEventType.MOUSE_UP:
@@ -136,6 +182,8 @@ class ResultsControl(UIControl):
 
 def show_abstract_popup(result: Dict[str, Any], console: Any) -> None:
     """Display the paper information and abstract for a result"""
+    from rich.panel import Panel
+
     # Extract all paper info
     title = result["title"]
     identifier = result["doi"]
@@ -191,16 +239,25 @@ def app(
     Console: Any,
     config: Dict,
     warnings: List[str] = None,
+    on_highlight: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Optional[str]:
     """
     Display results and let user navigate and select.
     Returns the selected DOI or None if user cancelled.
+    If given, `on_highlight` is called with each result that gets
+    highlighted (e.g., to start resolving it before the user selects it).
     """
 
     console = Console
     control = ResultsControl(results, original_query, warnings or [])
     show_abstract_mode = [False]  # Use list for mutability in nested function
 
+    def notify_highlight() -> None:
+        if on_highlight is not None:
+            result = control.get_selected_result()
+            if result:
+                on_highlight(result)
+
     # Key bindings
     kb = KeyBindings()
 
@@ -209,12 +266,14 @@ def app(
         """Move selection up"""
         if not show_abstract_mode[0]:
             control.move_cursor_up()
+            notify_highlight()
 
     @kb.add('down')
     def _(event):
         """Move selection down"""
         if not show_abstract_mode[0]:
             control.move_cursor_down()
+            notify_highlight()
 
     @kb.add('space')
     def _(event):
@@ -256,6 +315,8 @@ def app(
         erase_when_done=True,
     )
 
+    notify_highlight()
+
     # Main loop - handle abstract viewing
     while True:
         try:
@@ -267,13 +328,10 @@ def app(
                 if selected:
                     show_abstract_popup(selected, console)
                     # Wait for key press
-                    import sys, tty, termios
-                    old_settings = termios.tcgetattr(sys.stdin)
-                    try:
-                        tty.setraw(sys.stdin.fileno())
-                        sys.stdin.read(1)
-                    finally:
-                        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+                    if HAS_POSIX_TTY:
+                        read_key(sys.stdin.fileno())
+                    else:
+                        input()
 
                     show_abstract_mode[0] = False
                     # Continue the loop to show menu again
@@ -1,25 +1,103 @@
 
+import hashlib
+import os
+import re
+import sys
 import lazy_loader as lazy
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Hashable, Iterator, Union
 
 # Tous les imports sont lazy
 _bs4 = lazy.load('bs4')
-_re = lazy.load('re')
 _rapidocr = lazy.load('rapidocr_onnxruntime')
 _np = lazy.load('numpy')
 _pyperclip = lazy.load('pyperclip')
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Terminal modules used to read a single key press (not available on Windows)
+try:
+    import termios
+    import tty
+    HAS_POSIX_TTY = True
+except ImportError:
+    HAS_POSIX_TTY = False
+
+# Translation table (control chars -> space, typographic punctuation -> ASCII,
+# which otherwise defeats exact matches in searches) and pattern used by
+# normalize_text()
+_CTRL_TABLE = dict.fromkeys([*range(0x20), 0x7f], ' ')
+_PUNCT_TABLE = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-', '\u00a0': ' ',
+})
+_NORMALIZE_TABLE = {**_CTRL_TABLE, **_PUNCT_TABLE}
+_WS_RE = re.compile(r'\s+')
+
+# OCR results of recently seen images (users often paste the same screenshot
+# again, e.g., after a typo), keyed by a hash of the image content
+OCR_CACHE_SIZE = 64
+_ocr_cache: "OrderedDict[Hashable, str]" = OrderedDict()
+
+# Screenshots are often much larger than needed for text detection, so we
+# downscale images whose longest side exceeds this many pixels before OCR
+OCR_MAX_SIDE_LEN = 1536
+
+# Clipboard change count and image found at the last clipboard grab
+_clipboard_cache: List[Any] = [None, None]
+
+@contextmanager
+def cbreak_mode(fd: int) -> Iterator[None]:
+    """
+    Put the terminal in cbreak mode (single characters are delivered without
+    waiting for ENTER, but Ctrl+C still raises KeyboardInterrupt) and always
+    restore the previous settings on exit, even if an exception is raised.
+    """
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def read_key(fd: int) -> str:
+    """
+    Wait for a single key press on the terminal `fd` and return it (only its
+    first character for multi-byte keys). We read from the file descriptor
+    directly, as sys.stdin may buffer bytes that would then show up in the
+    next prompt.
+    """
+    with cbreak_mode(fd):
+        char = os.read(fd, 1).decode('utf-8', 'ignore')
+        # Discard the rest of multi-byte keys (e.g., "[A" of an arrow key,
+        # or UTF-8 continuation bytes), which would end up in the prompt
+        termios.tcflush(fd, termios.TCIFLUSH)
+    return char
+
 def normalize_text(text):
-    # remove control char
-    text = _re.sub(r'[\x00-\x1f\x7f]', ' ', text)
+    # Typed or pasted titles are usually already clean: plain printable ASCII
+    # has no control char nor punctuation to replace, so only repeated
+    # spaces could change
+    if text.isascii() and text.isprintable() and '  ' not in text:
+        return text
+
+    # remove control char and canonicalize punctuation (in a single pass)
+    text = text.translate(_NORMALIZE_TABLE)
     # remove extra space line break, tabulation, ect
-    text = _re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
 
     return text
 
+@lru_cache(maxsize=32)
 def parse_jats_text(text: str) -> str:
     """
     Parse JATS  (Journal Article Tag Suite) XML text (without adding external library) and convert to clean text.
+    Results are cached, as the same abstract is parsed again each time it is
+    viewed while browsing search results.
     """
     if not text:
         return text
@@ -51,56 +129,160 @@ def parse_jats_text(text: str) -> str:
             text = soup.get_text(separator=' ', strip=True)
 
         # Clean up extra whitespace
-        text = _re.sub(r'\s+', ' ', text)
-        text = _re.sub(r'\n\s+\n', '\n\n', text)
+        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'\n\s+\n', '\n\n', text)
 
         return text.strip()
 
     except Exception:
         # If parsing fails, try simple regex cleanup
-        text = _re.sub(r'<jats:[^>]+>', '', text)
-        text = _re.sub(r'</?[^>]+>', '', text)
-        text = _re.sub(r'\s+', ' ', text)
+        text = re.sub(r'<jats:[^>]+>', '', text)
+        text = re.sub(r'</?[^>]+>', '', text)
+        text = re.sub(r'\s+', ' ', text)
         return text.strip()
 
 
+def get_clipboard_change_count() -> Optional[int]:
+    """
+    Return a number that changes whenever the clipboard content changes
+    (clipboard sequence number on Windows, pasteboard change count on macOS),
+    or None if the platform does not provide one.
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        return ctypes.windll.user32.GetClipboardSequenceNumber()
+
+    if sys.platform == 'darwin':
+        try:
+            from AppKit import NSPasteboard
+        except ImportError:
+            return None
+        return NSPasteboard.generalPasteboard().changeCount()
+
+    return None
+
 def get_clipboard_image():
     """
     Get image from clipboard if available.
     Returns PIL Image or None.
+    Grabbing the clipboard is slow, so on platforms that tell us when the
+    clipboard changes, the last result is reused until it does.
     """
+    change_count = get_clipboard_change_count()
+    if change_count is not None and change_count == _clipboard_cache[0]:
+        return _clipboard_cache[1]
+
     from PIL import ImageGrab
     # Try to get image from clipboard
     img = ImageGrab.grabclipboard()
-    if img is not None and hasattr(img, 'save'):
-        return img
-    return None
+    if img is None or not hasattr(img, 'save'):
+        img = None
 
-def copy_to_clipboard(obj):
+    _clipboard_cache[:] = [change_count, img]
+    return img
+
+def copy_to_clipboard(obj: str) -> bool:
     try :
         _pyperclip.copy(obj)
         return True
     except Exception as e:
         return False
 
-def ocr(image_source) -> str:
+@lru_cache(maxsize=1)
+def get_ocr_engine() -> Any:
+    """
+    Return the RapidOCR engine, creating it on first use.
+    Creating the engine loads the ONNX models and sets up the inference
+    sessions, so we keep a single instance around for the whole session.
+    """
+    return _rapidocr.RapidOCR()
+
+def warm_up_ocr() -> None:
+    """
+    Create the OCR engine and run it once on a small blank image, so that
+    the first actual OCR does not pay for loading the models and setting up
+    the inference sessions. Errors are ignored (e.g., if RapidOCR is not
+    installed), they are reported when OCR is actually used.
+    """
+    try:
+        engine = get_ocr_engine()
+        engine(_np.zeros((32, 32, 3), dtype=_np.uint8), use_cls=False)
+    except Exception:
+        pass
+
+def _ocr_cache_key(image_source: Union[str, "Image.Image"]) -> Hashable:
+    """
+    Compute the key under which the OCR result for an image is cached.
+    Files are identified by path, size and modification time, PIL images by
+    a BLAKE2b digest of their raw pixel data (plus mode and dimensions).
+    """
+    if isinstance(image_source, str):
+        stat = os.stat(image_source)
+        return (image_source, stat.st_size, stat.st_mtime_ns)
+
+    digest = hashlib.blake2b(image_source.tobytes(), digest_size=16).digest()
+    return (image_source.mode, image_source.size, digest)
+
+def ocr(image_source: Union[str, "Image.Image"]) -> str:
     """
     Perform OCR on an image to extract text using RapidOCR.
     image_source can be a file path (str) or PIL Image object.
+    Results are cached, so OCR of an already seen image is instant.
     """
-    # Initialize RapidOCR engine
-    engine = _rapidocr.RapidOCR()
+    key = _ocr_cache_key(image_source)
+    if key in _ocr_cache:
+        _ocr_cache.move_to_end(key)
+        return _ocr_cache[key]
+
+    text = _run_ocr(image_source)
+
+    _ocr_cache[key] = text
+    if len(_ocr_cache) > OCR_CACHE_SIZE:
+        _ocr_cache.popitem(last=False)
+
+    return text
+
+def _run_ocr(image_source: Union[str, "Image.Image"]) -> str:
+    """
+    Run the RapidOCR engine on an image (without caching).
+    """
+    engine = get_ocr_engine()
 
     # Convert image to numpy array if needed
     if isinstance(image_source, str):
     # RapidOCR can handle file paths directly
         img_input = image_source
     else:
-        # Convert PIL Image to numpy array
-        img_input = _np.array(image_source)
+        # Downscale large images (bilinear is much cheaper than Lanczos and
+        # good enough for text); this does not modify the caller's image.
+        # Image.Resampling only exists since Pillow 9.1, older versions (still
+        # used with Python 3.8) have the filters on the module itself
+        width, height = image_source.size
+        scale = OCR_MAX_SIDE_LEN / max(width, height)
+        if scale < 1:
+            from PIL import Image
+            image_source = image_source.resize(
+                (max(1, round(width * scale)), max(1, round(height * scale))),
+                getattr(Image, "Resampling", Image).BILINEAR,
+            )
+
+        # Convert PIL Image to numpy array. RapidOCR takes arrays as BGR (like
+        # OpenCV), so drop any alpha channel and reverse the channels here,
+        # which costs a single copy and spares a color conversion in RapidOCR.
+        # Grayscale images are passed as they are (np.asarray() does not copy
+        # the image data again, and RapidOCR handles 2D arrays)
+        if image_source.mode == '1':
+            image_source = image_source.convert('L')
+        if image_source.mode == 'L':
+            img_input = _np.asarray(image_source)
+        else:
+            if image_source.mode != 'RGB':
+                image_source = image_source.convert('RGB')
+            img_input = _np.ascontiguousarray(_np.asarray(image_source)[..., ::-1])
 
-    # Perform OCR
-    result, elapse = engine(img_input)
+    # Perform OCR. The text direction classifier is skipped: it only detects
+    # text rotated by 180 degrees, which does not occur in screenshots
+    result, elapse = engine(img_input, use_cls=False)
 
     # Extract text from results
     # result is a list of [bbox, text, score] or None if no text detected
@@ -120,16 +302,14 @@ def format_authors(authors: List[Dict[str, str]], max_authors: int = 3) -> str:
     if not authors:
         return "Unknown authors"
 
-    formatted = []
-    for author in authors[:max_authors]:
-        given = author.get("given", "")
-        family = author.get("family", "")
-        if given and family:
-            formatted.append(f"{given} {family}")
-        elif family:
-            formatted.append(family)
+    # Authors without a family name are skipped
+    formatted = ", ".join(
+        f"{author['given']} {author['family']}" if author.get("given") else author["family"]
+        for author in islice(authors, max_authors)
+        if author.get("family")
+    )
 
     if len(authors) > max_authors:
-        formatted.append("et al.")
+        formatted = f"{formatted}, et al." if formatted else "et al."
 
-    return ", ".join(formatted)
+    return formatted
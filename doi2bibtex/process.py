@@ -6,15 +6,17 @@ Look up a BibTeX entry based on a DOI or arXiv ID.
 # IMPORTS
 # -----------------------------------------------------------------------------
 
-import re
-
 from bibtexparser.customization import splitname
 
 from doi2bibtex.ads import get_ads_bibcode_for_identifier
 from doi2bibtex.config import Configuration
 from doi2bibtex.constants import JOURNAL_ABBREVIATIONS
 from doi2bibtex.dblp import crossmatch_with_dblp
-from doi2bibtex.identify import is_arxiv_id
+from doi2bibtex.identify import (
+    is_arxiv_id,
+    preprocess_arxiv_identifier,
+    remove_non_printable,
+)
 from doi2bibtex.utils import (
     doi_to_url,
     latex_to_unicode,
@@ -25,68 +27,6 @@ from doi2bibtex.utils import (
 # -----------------------------------------------------------------------------
 # DEFINITIONS
 # -----------------------------------------------------------------------------
-def preprocess_arxiv_identifier(identifier: str) -> str:
-    """
-    Extract the arXiv ID from various formats.
-
-    Supports:
-    - https://arxiv.org/abs/XXXX.XXXXX
-    - arxiv.org/abs/XXXX.XXXXX
-    - https://doi.org/10.48550/arXiv.XXXX.XXXXX
-    - doi.org/10.48550/arXiv.XXXX.XXXXX
-    - 10.48550/arXiv.XXXX.XXXXX
-    - arXiv.XXXX.XXXXX or arXiv:XXXX.XXXXX
-    - XXXX.XXXXX (plain ID)
-
-    Works with old format (pre-2007): arch-ive/YYMMNNN
-    Works with new format (post-2007): YYMM.NNNNN
-
-    With or without 'www' and case-insensitive for 'arXiv'.
-
-    Returns the extracted arXiv ID or the original identifier if no pattern matches.
-    """
-
-    identifier = identifier.lower()
-
-    # Pattern for https://arxiv.org/abs/... or arxiv.org/abs/...
-    arxiv_url_match = re.search(
-        r"(?:https?://)?(?:www\.)?arxiv\.org/abs/(.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if arxiv_url_match:
-        return arxiv_url_match.group(1).strip()
-
-    # Pattern for DOI URLs: https://doi.org/10.48550/arXiv.XXXX.XXXXX
-    doi_url_match = re.search(
-        r"(?:https?://)?(?:www\.)?doi\.org/10\.48550/arxiv[\.:](.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if doi_url_match:
-        return doi_url_match.group(1).strip()
-
-    # Pattern for DOI without domain: 10.48550/arXiv.XXXX.XXXXX
-    doi_prefix_match = re.search(
-        r"^10\.48550/arxiv[\.:](.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if doi_prefix_match:
-        return doi_prefix_match.group(1).strip()
-
-    # Pattern for arXiv prefix: arXiv.XXXX.XXXXX or arXiv:XXXX.XXXXX
-    arxiv_prefix_match = re.search(
-        r"^arxiv[\.:](.+)",
-        identifier,
-        re.IGNORECASE
-    )
-    if arxiv_prefix_match:
-        return arxiv_prefix_match.group(1).strip()
-
-    # Return the identifier as-is if no pattern matched
-    return identifier
-
 def preprocess_identifier(identifier: str) -> str:
     """
     Pre-process the given `identifier`: Remove any leading or trailing
@@ -95,7 +35,7 @@ def preprocess_identifier(identifier: str) -> str:
     """
 
     # Remove non-printable ASCII characters and whitespace (keep only characters from ! to ~)
-    identifier = re.sub(r'[^\x21-\x7E]', '', identifier)
+    identifier = remove_non_printable(identifier)
 
     # Remove the "doi:" prefix
     if identifier.startswith("doi:") or identifier.startswith("DOI:"):
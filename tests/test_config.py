@@ -35,6 +35,7 @@ def mock_open(request: Any, mocker: Any) -> None:
         yaml_file = """
         limit_authors: 3
         ignored_property: "some value"
+        load_from_yaml_file: "not a setting"
         """
 
     # Patch the built-in `open()` function to return the fake YAML file
@@ -54,7 +55,7 @@ def test__configuration(
         m.setattr(Path, 'exists', lambda _: False)
         config = Configuration()
     assert config.limit_authors == 1000
-    assert len(str(config).split('\n')) == len(vars(config)) + 2
+    assert len(str(config).split('\n')) == len(Configuration.__slots__) + 2
 
     # Copy the default configuration object (we will use this later)
     default_config = deepcopy(config)
@@ -78,5 +79,7 @@ def test__configuration(
             with pytest.warns(UserWarning) as user_warning:
                 config = Configuration()
         assert "Ignoring unknown " in str(user_warning[0].message)
+        # Names of methods are not settings either
+        assert '"load_from_yaml_file"' in str(user_warning[1].message)
         assert config.limit_authors == 3
-        assert 'ignored_property' not in vars(config)
+        assert not hasattr(config, 'ignored_property')
@@ -11,6 +11,8 @@ from doi2bibtex.identify import (
     is_arxiv_id,
     is_doi,
     is_isbn,
+    preprocess_arxiv_identifier,
+    remove_non_printable,
 )
 
 
@@ -26,8 +28,10 @@ def test__is_doi() -> None:
     assert is_doi('10.1051/0004-6361/202142529')
     assert is_doi('10.1002/best.202010001')
     assert is_doi('10.1021/ac0341261')
+    assert is_doi('10.1207/s15327906mbr1202&3_4')
 
     assert not is_doi('2010.05591')
+    assert not is_doi('10.1051/0004-6361/202142529 trailing')
 
 
 def test__is_arxiv_id() -> None:
@@ -37,10 +41,39 @@ def test__is_arxiv_id() -> None:
 
     assert is_arxiv_id('2010.05591')
     assert is_arxiv_id('math.GT/0309136')
+    assert is_arxiv_id('hep-th/9901001v2')
+    assert is_arxiv_id('2010.05591v3')
 
     assert not is_arxiv_id('10.1051/0004-6361/202142529')
 
 
+def test__preprocess_arxiv_identifier() -> None:
+    """
+    Test `preprocess_arxiv_identifier()`.
+    """
+
+    assert preprocess_arxiv_identifier("2301.07041") == "2301.07041"
+    assert preprocess_arxiv_identifier("arXiv:2301.07041") == "2301.07041"
+    assert preprocess_arxiv_identifier(" arXiv: 2301.07041\n") == "2301.07041"
+    assert preprocess_arxiv_identifier("2301.\t07041\u00a0") == "2301.07041"
+    assert (
+        preprocess_arxiv_identifier("https://arxiv.org/abs/2301.07041V2")
+        == "2301.07041v2"
+    )
+    assert (
+        preprocess_arxiv_identifier("https://arXiv.org/abs/math.GT/0309136")
+        == "math.GT/0309136"
+    )
+    assert (
+        preprocess_arxiv_identifier("ARXIV:MATH.GT/0309136V2")
+        == "math.GT/0309136v2"
+    )
+    assert (
+        preprocess_arxiv_identifier("https://doi.org/10.48550/ARXIV.2301.07041")
+        == "2301.07041"
+    )
+
+
 def test__is_ads_bibcode() -> None:
     """
     Test `is_ads_bibcode()`.
@@ -76,3 +109,27 @@ def test__is_isbn() -> None:
     assert not is_isbn('9700000000000')
     assert not is_isbn('9000000000000')
     assert not is_isbn('9710000000000')
+
+
+def test__remove_non_printable() -> None:
+    """
+    Test `remove_non_printable()`.
+    """
+
+    assert remove_non_printable("10.1234/abc") == "10.1234/abc"
+    assert remove_non_printable(" 10.1234/\tabc\n\x7f") == "10.1234/abc"
+    assert remove_non_printable("2301.07041\u00a0\u200b") == "2301.07041"
+
+
+def test__memoization() -> None:
+    """
+    Test that the identifier predicates are memoized.
+    """
+
+    is_doi.cache_clear()
+    assert is_doi('10.1021/ac0341261')
+    assert is_doi('10.1021/ac0341261')
+    assert is_doi.cache_info().hits == 1
+
+    is_doi.cache_clear()
+    assert is_doi.cache_info().currsize == 0
@@ -6,6 +6,7 @@ Unit tests for interactive.py.
 # IMPORTS
 # -----------------------------------------------------------------------------
 
+from collections import OrderedDict
 from typing import Any
 from unittest.mock import Mock, MagicMock
 
@@ -126,6 +127,24 @@ def test__resolve_title__no_results(monkeypatch: pytest.MonkeyPatch) -> None:
     assert isinstance(warnings, list)
 
 
+def test__normalize_text() -> None:
+    """
+    Test `normalize_text()`.
+    """
+
+    from doi2bibtex.interactive.utils import normalize_text
+
+    assert normalize_text("Attention is all you need") == "Attention is all you need"
+    assert normalize_text("Attention\nis  all\tyou\x00need") == "Attention is all you need"
+    assert normalize_text(" \r\n ") == " "
+    assert normalize_text("a  b") == "a b"
+    assert normalize_text("a b\x7f") == "a b "
+    assert (
+        normalize_text("\u201cWhat\u2019s\u00a0new\u201d \u2014 a review")
+        == "\"What's new\" - a review"
+    )
+
+
 def test__format_authors() -> None:
     """
     Test `format_authors()`.
@@ -155,6 +174,11 @@ def test__format_authors() -> None:
     result = format_authors(authors_no_given, max_authors=3)
     assert result == "Doe, Jane Smith"
 
+    # Test with authors without family name (skipped)
+    authors_no_family = [{"given": "John"}, {"given": "Jane"}]
+    assert format_authors(authors_no_family, max_authors=3) == ""
+    assert format_authors(authors_no_family, max_authors=1) == "et al."
+
     # Test with empty list
     result = format_authors([])
     assert result == "Unknown authors"
@@ -225,3 +249,640 @@ def test__get_clipboard_image__no_pil(monkeypatch: pytest.MonkeyPatch) -> None:
     result = get_clipboard_image()
     # When PIL is not available, the function returns None
     assert result is None
+
+
+def test__get_ocr_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `get_ocr_engine()` only creates the RapidOCR engine once.
+    """
+
+    import doi2bibtex.interactive.utils as utils
+
+    mock_rapidocr = MagicMock()
+    monkeypatch.setattr(utils, "_rapidocr", mock_rapidocr)
+    utils.get_ocr_engine.cache_clear()
+
+    try:
+        engine = utils.get_ocr_engine()
+        assert utils.get_ocr_engine() is engine
+        mock_rapidocr.RapidOCR.assert_called_once_with()
+    finally:
+        utils.get_ocr_engine.cache_clear()
+
+
+def test__warm_up_ocr(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `warm_up_ocr()` runs the engine once and ignores errors.
+    """
+
+    import doi2bibtex.interactive.utils as utils
+
+    engine = Mock()
+    monkeypatch.setattr(utils, "get_ocr_engine", lambda: engine)
+    utils.warm_up_ocr()
+    assert engine.call_args[0][0].shape == (32, 32, 3)
+
+    engine.side_effect = RuntimeError("no models")
+    utils.warm_up_ocr()
+
+
+def test__ocr__cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `ocr()` only runs the engine once for identical images.
+    """
+
+    from PIL import Image
+
+    import doi2bibtex.interactive.utils as utils
+
+    engine = MagicMock(return_value=([[None, "Some title", 0.9]], 0.1))
+    monkeypatch.setattr(utils, "get_ocr_engine", lambda: engine)
+    monkeypatch.setattr(utils, "_ocr_cache", type(utils._ocr_cache)())
+
+    assert utils.ocr(Image.new("RGB", (32, 32), "white")) == "Some title"
+    assert utils.ocr(Image.new("RGB", (32, 32), "white")) == "Some title"
+    assert engine.call_count == 1
+
+    # A different image is not served from the cache
+    assert utils.ocr(Image.new("RGB", (32, 32), "black")) == "Some title"
+    assert engine.call_count == 2
+
+
+def test__ocr__downscale(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `ocr()` downscales large images before running the engine.
+    """
+
+    from PIL import Image
+
+    import doi2bibtex.interactive.utils as utils
+
+    engine = MagicMock(return_value=(None, 0.1))
+    monkeypatch.setattr(utils, "get_ocr_engine", lambda: engine)
+    monkeypatch.setattr(utils, "_ocr_cache", type(utils._ocr_cache)())
+
+    image = Image.new("RGB", (4000, 1000), "white")
+    assert utils.ocr(image) == ""
+    assert engine.call_args[0][0].shape[:2] == (384, 1536)
+    assert engine.call_args[1] == {"use_cls": False}
+    assert image.size == (4000, 1000)
+
+
+def test__ocr__bgr(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `ocr()` passes PIL images to the engine as BGR arrays.
+    """
+
+    from PIL import Image
+
+    import doi2bibtex.interactive.utils as utils
+
+    engine = MagicMock(return_value=(None, 0.1))
+    monkeypatch.setattr(utils, "get_ocr_engine", lambda: engine)
+    monkeypatch.setattr(utils, "_ocr_cache", type(utils._ocr_cache)())
+
+    utils.ocr(Image.new("RGBA", (8, 8), (255, 128, 0, 255)))
+    img_input = engine.call_args[0][0]
+    assert img_input.shape == (8, 8, 3)
+    assert img_input.flags["C_CONTIGUOUS"]
+    assert tuple(img_input[0, 0]) == (0, 128, 255)
+
+    # Grayscale images are passed as 2D arrays
+    utils.ocr(Image.new("L", (8, 8), 42))
+    img_input = engine.call_args[0][0]
+    assert img_input.shape == (8, 8)
+    assert img_input[0, 0] == 42
+
+
+def test__cbreak_mode() -> None:
+    """
+    Test that `cbreak_mode()` restores the terminal settings, also on error.
+    """
+
+    pty = pytest.importorskip("pty")
+    termios = pytest.importorskip("termios")
+
+    from doi2bibtex.interactive.utils import cbreak_mode
+
+    master_fd, slave_fd = pty.openpty()
+    try:
+        before = termios.tcgetattr(slave_fd)
+
+        with cbreak_mode(slave_fd):
+            assert not termios.tcgetattr(slave_fd)[3] & termios.ICANON
+        assert termios.tcgetattr(slave_fd) == before
+
+        with pytest.raises(KeyboardInterrupt):
+            with cbreak_mode(slave_fd):
+                raise KeyboardInterrupt
+        assert termios.tcgetattr(slave_fd) == before
+    finally:
+        import os
+        os.close(master_fd)
+        os.close(slave_fd)
+
+
+def test__get_clipboard_image__change_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `get_clipboard_image()` only grabs the clipboard on changes.
+    """
+
+    from PIL import Image, ImageGrab
+
+    import doi2bibtex.interactive.utils as utils
+
+    image = Image.new("RGB", (8, 8))
+    grab = MagicMock(return_value=image)
+    monkeypatch.setattr(ImageGrab, "grabclipboard", grab)
+    monkeypatch.setattr(utils, "_clipboard_cache", [None, None])
+
+    # Unknown change count: the clipboard is grabbed every time
+    monkeypatch.setattr(utils, "get_clipboard_change_count", lambda: None)
+    assert utils.get_clipboard_image() is image
+    assert utils.get_clipboard_image() is image
+    assert grab.call_count == 2
+
+    # Known change count: the clipboard is only grabbed when it changed
+    count = [1]
+    monkeypatch.setattr(utils, "get_clipboard_change_count", lambda: count[0])
+    assert utils.get_clipboard_image() is image
+    assert utils.get_clipboard_image() is image
+    assert grab.call_count == 3
+    count[0] = 2
+    grab.return_value = None
+    assert utils.get_clipboard_image() is None
+    assert grab.call_count == 4
+
+
+def test__results_control__render_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `ResultsControl` extracts the text of each result once, and
+    only renders rows whose selection changed.
+    """
+
+    import doi2bibtex.interactive.selection as selection
+
+    formatted = []
+    rendered = []
+
+    def mock_format_authors(authors: Any, max_authors: int = 3) -> str:
+        formatted.append(authors)
+        return "Unknown authors"
+
+    render_result = selection.ResultsControl.render_result
+
+    def mock_render_result(self: Any, i: int, is_selected: bool) -> Any:
+        rendered.append((i, is_selected))
+        return render_result(self, i, is_selected)
+
+    monkeypatch.setattr(selection, "format_authors", mock_format_authors)
+    monkeypatch.setattr(selection.ResultsControl, "render_result", mock_render_result)
+
+    results = [
+        {"title": f"Paper {i}", "doi": f"10.1234/{i}", "source": "crossref"}
+        for i in range(3)
+    ]
+    control = selection.ResultsControl(results, "query")
+    assert len(formatted) == 3
+
+    content = control.create_content(width=80, height=40)
+    assert content.get_line(2) == [("class:selected fg:#fff176", "► [1] Paper 0")]
+    assert content.get_line(3) == [
+        ("class:selected bold", "    Identifier: 10.1234/0 "),
+        ("class:selected italic", "(from crossref)"),
+    ]
+    assert rendered == [(0, True), (1, False), (2, False)]
+
+    # Redrawing without moving the selection reuses the content as it is
+    assert control.create_content(width=80, height=40) is content
+    assert len(rendered) == 3
+
+    # Moving the selection only renders the two rows whose style changed
+    control.move_cursor_down()
+    content = control.create_content(width=80, height=40)
+    assert content.get_line(2) == [("fg:cyan", "  [1] Paper 0")]
+    assert content.get_line(8) == [("class:selected fg:#fff176", "► [2] Paper 1")]
+    assert rendered[3:] == [(0, False), (1, True)]
+    assert len(formatted) == 3
+
+
+def test__ocr_image(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test `ocr_image()`.
+    """
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    console = MagicMock()
+
+    monkeypatch.setattr(interactive, "ocr", lambda image: "Some title")
+    assert ocr_image("image.png", console) == "Some title"
+
+    def failing_ocr(image: Any) -> str:
+        raise RuntimeError("no engine")
+
+    monkeypatch.setattr(interactive, "ocr", failing_ocr)
+    assert ocr_image("image.png", console) == "Error performing OCR: no engine"
+
+
+def test__get_bibtex_highlighting() -> None:
+    """
+    Test `get_bibtex_highlighting()`.
+    """
+
+    from doi2bibtex.interactive.interactive import get_bibtex_highlighting
+
+    lexer, theme = get_bibtex_highlighting("default")
+    assert "bibtex" in lexer.aliases
+    assert get_bibtex_highlighting("default")[0] is lexer
+    assert get_bibtex_highlighting("monokai")[1] is not theme
+
+
+def test__session_history() -> None:
+    """
+    Test `SessionHistory`.
+    """
+
+    from doi2bibtex.interactive.interactive import SessionHistory
+
+    history = SessionHistory(max_size=3)
+    for string in ["a", "b", "a", "c", "d"]:
+        history.append_string(string)
+
+    # "a" is only kept once, and "b" was dropped to keep at most 3 entries
+    assert history.get_strings() == ["a", "c", "d"]
+    assert list(history.load_history_strings()) == ["d", "c", "a"]
+
+    history.append_string("b")
+    assert history.get_strings() == ["c", "d", "b"]
+
+
+def test__linux_terminal_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `linux_terminal_buffer()` copies the entry on 'c' only, and
+    does not leave the rest of multi-byte keys in the input queue.
+    """
+
+    pty = pytest.importorskip("pty")
+
+    import io
+    import os
+    import select
+    import sys
+    from contextlib import contextmanager
+
+    import doi2bibtex.interactive.interactive as interactive
+    import doi2bibtex.interactive.utils as utils
+
+    copied = []
+    monkeypatch.setattr(
+        interactive, "bibtex_to_clipboard", lambda _, bibtex: copied.append(bibtex)
+    )
+
+    # Entering cbreak mode flushes pending input, so we only "type" the key
+    # once the terminal is in cbreak mode
+    cbreak_mode = utils.cbreak_mode
+    key = [b""]
+
+    @contextmanager
+    def cbreak_mode_and_type(fd: int) -> Any:
+        with cbreak_mode(fd):
+            os.write(master_fd, key[0])
+            yield
+
+    monkeypatch.setattr(utils, "cbreak_mode", cbreak_mode_and_type)
+
+    for key[0], expected in [
+        (b"C", ["@misc{a}"]),
+        (b"x", []),
+        (b"\x1b[A", []),
+        ("é".encode("utf-8"), []),
+    ]:
+        copied.clear()
+        master_fd, slave_fd = pty.openpty()
+        try:
+            monkeypatch.setattr(
+                sys, "stdin", io.TextIOWrapper(io.FileIO(slave_fd, closefd=False))
+            )
+            interactive.linux_terminal_buffer(MagicMock(), "@misc{a}")
+            assert copied == expected
+            assert select.select([slave_fd], [], [], 0.1)[0] == []
+        finally:
+            os.close(master_fd)
+            os.close(slave_fd)
+
+
+def test__key_bindings__paste_image(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the Ctrl+V key binding with and without an image in the clipboard.
+    """
+
+    import threading
+
+    from prompt_toolkit.input import create_pipe_input
+    from prompt_toolkit.output import DummyOutput
+    from prompt_toolkit.shortcuts import PromptSession
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    toolbar_message = [None]
+    pasted_image = [None]
+    kb = interactive.key_bindings(
+        toolbar_message=toolbar_message,
+        search_mode=["title"],
+        txt_buffer=[None],
+        pasted_image=pasted_image,
+    )
+
+    # With an image, the prompt exits to start the OCR on that image
+    image = object()
+    monkeypatch.setattr(interactive, "get_clipboard_image", lambda: image)
+    with create_pipe_input() as pipe_input:
+        session = PromptSession(
+            key_bindings=kb, input=pipe_input, output=DummyOutput()
+        )
+        pipe_input.send_text("\x16")
+        assert session.prompt() == interactive.RESULT_OCR_REQUESTED
+    assert pasted_image[0] is image
+    pasted_image[0] = None
+
+    # Without an image, a warning is shown and the prompt stays open (the
+    # input is only validated once the clipboard has been checked)
+    with create_pipe_input() as pipe_input:
+
+        def no_clipboard_image() -> None:
+            threading.Timer(0.1, pipe_input.send_text, ["title\r"]).start()
+
+        monkeypatch.setattr(interactive, "get_clipboard_image", no_clipboard_image)
+        session = PromptSession(
+            key_bindings=kb, input=pipe_input, output=DummyOutput()
+        )
+        pipe_input.send_text("\x16")
+        assert session.prompt() == "title"
+    assert toolbar_message[0] == ("warning", "No image")
+    assert pasted_image[0] is None
+
+
+def test__bottom_toolbar() -> None:
+    """
+    Test that `bottom_toolbar()` reuses the toolbar until the mode or the
+    message changes.
+    """
+
+    from doi2bibtex.interactive.interactive import MODE_TOOLBARS, bottom_toolbar
+
+    search_mode = ["title"]
+    toolbar_message: list = [None]
+    toolbar = bottom_toolbar(toolbar_message=toolbar_message, search_mode=search_mode)
+    assert toolbar is MODE_TOOLBARS["title"]
+    assert toolbar[0] == ('bg:#0066cc #ffffff bold', ' Title Mode ')
+
+    toolbar_message[0] = ("warning", "No image")
+    toolbar = bottom_toolbar(toolbar_message=toolbar_message, search_mode=search_mode)
+    assert toolbar[-1] == ('bg:#f57c00 #ffffff bold', ' ⚠ No image ')
+    assert bottom_toolbar(toolbar_message=toolbar_message, search_mode=search_mode) is toolbar
+    assert len(MODE_TOOLBARS["title"]) == 5
+
+    search_mode[0] = "doi"
+    toolbar_message[0] = ("error", "Search error")
+    toolbar = bottom_toolbar(toolbar_message=toolbar_message, search_mode=search_mode)
+    assert toolbar[2] == ('bg:#0066cc #ffffff bold', ' DOI Mode ')
+    assert toolbar[-1] == ('bg:#d32f2f #ffffff bold', ' ✗ Search error ')
+
+
+def test__handle_user_doi(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test `handle_user_doi()`, including Ctrl+C while resolving.
+    """
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    display_bibtex = Mock()
+    monkeypatch.setattr(interactive, "display_bibtex", display_bibtex)
+    monkeypatch.setattr(interactive, "_resolve_cache", OrderedDict())
+    monkeypatch.setattr(
+        interactive, "resolve_identifier", lambda **kwargs: "@article{a}"
+    )
+
+    toolbar_message: list = [None]
+    assert interactive.handle_user_doi(
+        console=MagicMock(),
+        config=None,
+        identifier="10.1000/a",
+        toolbar_message=toolbar_message,
+    )
+    assert display_bibtex.call_args[0][0] == "@article{a}"
+
+    # Ctrl+C stops waiting for the lookup and returns to the prompt
+    future = Mock(**{"result.side_effect": KeyboardInterrupt})
+    monkeypatch.setattr(interactive, "run_in_daemon_thread", lambda *args: future)
+    assert not interactive.handle_user_doi(
+        console=MagicMock(),
+        config=None,
+        identifier="10.1000/b",
+        toolbar_message=toolbar_message,
+    )
+    future.cancel.assert_called_once()
+    assert toolbar_message[0] == ("warning", "Cancelled")
+    assert display_bibtex.call_count == 1
+
+
+def test__cached_resolve(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `cached_resolve_identifier()` and `cached_resolve_title()` only
+    go through the network once per input, except for failed lookups.
+    """
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    monkeypatch.setattr(interactive, "_resolve_cache", OrderedDict())
+    monkeypatch.setattr(interactive, "RESOLVE_CACHE_SIZE", 2)
+
+    resolve_identifier = Mock(side_effect=[RuntimeError("timeout"), "@a", "@b", "@a"])
+    monkeypatch.setattr(interactive, "resolve_identifier", resolve_identifier)
+    with pytest.raises(RuntimeError):
+        interactive.cached_resolve_identifier("10.1000/a", None)
+    assert interactive.cached_resolve_identifier("10.1000/a", None) == "@a"
+    assert interactive.cached_resolve_identifier("10.1000/a", None) == "@a"
+    assert resolve_identifier.call_count == 2
+
+    results = [{"title": "A title", "doi": "10.1000/a"}]
+    resolve_title = Mock(side_effect=[(results, ["OpenAlex failed"]), (results, [])])
+    monkeypatch.setattr(interactive, "resolve_title", resolve_title)
+    assert interactive.cached_resolve_title("A title", None)[1] == ["OpenAlex failed"]
+    assert interactive.cached_resolve_title("A title", None) == (results, [])
+    assert interactive.cached_resolve_title("A title", None) == (results, [])
+    assert resolve_title.call_count == 2
+
+    # The least recently used lookup is dropped once the cache is full
+    assert interactive.cached_resolve_identifier("10.1000/b", None) == "@b"
+    assert interactive.cached_resolve_title("A title", None) == (results, [])
+    assert interactive.cached_resolve_identifier("10.1000/a", None) == "@a"
+    assert resolve_identifier.call_count == 4
+    assert resolve_title.call_count == 2
+
+
+def test__wait_for() -> None:
+    """
+    Test that `wait_for()` only shows a spinner for results that take time.
+    """
+
+    from concurrent.futures import Future, ThreadPoolExecutor
+    import time
+
+    from doi2bibtex.interactive.interactive import SPINNER_DELAY, wait_for
+
+    console = MagicMock()
+    future: Future = Future()
+    future.set_result("@article{a}")
+    assert wait_for(future, console, "Resolving DOI...") == "@article{a}"
+    console.status.assert_not_called()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(lambda: time.sleep(2 * SPINNER_DELAY) or "@article{b}")
+        assert wait_for(future, console, "Resolving DOI...") == "@article{b}"
+    console.status.assert_called_once_with("Resolving DOI...")
+
+
+def test__resolve_user_input__identifier_in_title_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that DOIs and arXiv IDs entered in title mode are resolved directly.
+    """
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    handle_user_doi = Mock()
+    cached_resolve_title = Mock(return_value=([], []))
+    monkeypatch.setattr(interactive, "handle_user_doi", handle_user_doi)
+    monkeypatch.setattr(interactive, "cached_resolve_title", cached_resolve_title)
+
+    for input_text in ["10.1038/nature14539", "arXiv:1706.03762"]:
+        interactive.resolve_user_input(
+            console=MagicMock(),
+            search_mode=["title"],
+            input_text=input_text,
+            config=None,
+            toolbar_message=[None],
+        )
+        assert handle_user_doi.call_args[1]["identifier"] == input_text
+    cached_resolve_title.assert_not_called()
+
+    interactive.resolve_user_input(
+        console=MagicMock(),
+        search_mode=["title"],
+        input_text="Attention is all you need",
+        config=None,
+        toolbar_message=[None],
+    )
+    cached_resolve_title.assert_called_once_with("Attention is all you need", None)
+
+
+def test__parse_jats_text() -> None:
+    """
+    Test `parse_jats_text()`, and that parsed abstracts are cached.
+    """
+
+    from doi2bibtex.interactive.utils import parse_jats_text
+
+    abstract = (
+        "<jats:title>Abstract</jats:title>"
+        "<jats:p>First  paragraph.</jats:p><jats:p>Second paragraph.</jats:p>"
+    )
+    parse_jats_text.cache_clear()
+    assert parse_jats_text(abstract) == "First paragraph. Second paragraph."
+    assert parse_jats_text(abstract) == "First paragraph. Second paragraph."
+    assert parse_jats_text.cache_info().hits == 1
+    assert parse_jats_text("Plain abstract") == "Plain abstract"
+
+
+def test__display_bibtex__not_a_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that `display_bibtex()` reads a line if stdin is not a terminal.
+    """
+
+    import io
+    import sys
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    copied = []
+    monkeypatch.setattr(
+        interactive, "bibtex_to_clipboard", lambda _, bibtex: copied.append(bibtex)
+    )
+    monkeypatch.setattr(sys, "stdin", io.StringIO("c\n"))
+
+    config = Mock(pygments_theme="default")
+    interactive.display_bibtex("@misc{a}", MagicMock(), config)
+    assert copied == ["@misc{a}"]
+
+
+def test__run_in_daemon_thread() -> None:
+    """
+    Test `run_in_daemon_thread()`.
+    """
+
+    import threading
+
+    from doi2bibtex.interactive.interactive import run_in_daemon_thread
+
+    future = run_in_daemon_thread(lambda: threading.current_thread().daemon)
+    assert future.result(timeout=1) is True
+
+    future = run_in_daemon_thread(int, "not a number")
+    with pytest.raises(ValueError):
+        future.result(timeout=1)
+
+    # Calls sharing a lock run one at a time, and can be cancelled while
+    # they wait for it
+    lock = threading.Lock()
+    with lock:
+        waiting = run_in_daemon_thread(int, "1", lock=lock)
+        assert not waiting.running()
+        assert waiting.cancel()
+        queued = run_in_daemon_thread(int, "2", lock=lock)
+    assert queued.result(timeout=1) == 2
+    assert waiting.cancelled()
+
+
+def test__resolve_user_input__prefetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that only the search results the selection stays on are resolved
+    in advance, and that the selected one is then reused.
+    """
+
+    import time
+
+    import doi2bibtex.interactive.interactive as interactive
+
+    results = [{"title": f"Title {i}", "doi": f"10.1000/{i}"} for i in range(3)]
+    monkeypatch.setattr(interactive, "cached_resolve_title", lambda *args: (results, []))
+    monkeypatch.setattr(interactive, "PREFETCH_DELAY", 0.05)
+    resolved = []
+    monkeypatch.setattr(
+        interactive,
+        "cached_resolve_identifier",
+        lambda doi, config: resolved.append(doi) or f"@misc{{{doi}}}",
+    )
+
+    def select_from_results(*args: Any, on_highlight: Any) -> str:
+        # Scroll quickly through the first results, then stay on the last one
+        for result in results:
+            on_highlight(result)
+        time.sleep(0.2)
+        return results[-1]["doi"]
+
+    monkeypatch.setattr(interactive, "select_from_results", select_from_results)
+    handle_user_doi = Mock()
+    monkeypatch.setattr(interactive, "handle_user_doi", handle_user_doi)
+
+    interactive.resolve_user_input(
+        console=MagicMock(),
+        search_mode=["title"],
+        input_text="Title",
+        config=None,
+        toolbar_message=[None],
+    )
+    assert resolved == ["10.1000/2"]
+    assert handle_user_doi.call_args[1]["prefetched"].result(timeout=1) == "@misc{10.1000/2}"
@@ -14,6 +14,7 @@ import pytest
 
 from doi2bibtex.ads import get_ads_token
 from doi2bibtex.config import Configuration
+from doi2bibtex.identify import is_arxiv_id
 from doi2bibtex.process import (
     preprocess_arxiv_identifier,
     preprocess_identifier,
@@ -87,6 +88,18 @@ def test__preprocess_identifier() -> None:
     assert preprocess_identifier("arXiv:identifier") == "identifier"
     assert preprocess_identifier("arxiv:identifier") == "identifier"
 
+    # Extracted arXiv IDs are lower-cased, except for the subject class of
+    # old-style IDs
+    for identifier, expected in [
+        ("ARXIV:HEP-TH/9901001", "hep-th/9901001"),
+        ("https://arxiv.org/abs/Hep-Th/9901001", "hep-th/9901001"),
+        ("https://arxiv.org/abs/2301.07041V2", "2301.07041v2"),
+        ("https://arXiv.org/abs/math.GT/0309136", "math.GT/0309136"),
+        ("arXiv:Math.gt/0309136v1", "math.GT/0309136v1"),
+    ]:
+        assert preprocess_identifier(identifier) == expected
+        assert is_arxiv_id(preprocess_identifier(identifier))
+
 
 def test__postprocess_bibtex(monkeypatch: pytest.MonkeyPatch) -> None:
     """